@@ -12,6 +12,7 @@ from kbc.env_handler import KBCEnvHandler
 from pathlib import Path
 
 from kbc_scripts import kbcapi_scripts
+from progress_reporter import ProgressReporter, SUMMARY_FIELDS, count_csv_rows
 
 # configuration variables
 KEY_SRC_TOKEN = '#src_token'
@@ -19,6 +20,7 @@ PAR_CONFIG_LISTS = 'configs.csv'
 KEY_API_TOKEN = '#api_token'
 KEY_REGION = 'aws_region'
 KEY_DST_REGION = 'dst_aws_region'
+KEY_PROGRESS_INTERVAL = 'progress_interval'
 # #### Keep for debug
 KEY_DEBUG = 'debug'
 
@@ -27,6 +29,8 @@ MANDATORY_IMAGE_PARS = []
 
 APP_VERSION = '0.0.1'
 
+DEFAULT_PROGRESS_INTERVAL = 60
+
 
 class Component(KBCEnvHandler):
 
@@ -64,11 +68,34 @@ class Component(KBCEnvHandler):
         params = self.cfg_params  # noqa
         configs_path = os.path.join(self.tables_in_path, PAR_CONFIG_LISTS)
         out_file_path = os.path.join(self.tables_out_path, 'transferred_configs_log.csv')
+        summary_file_path = os.path.join(self.tables_out_path, 'migration_run_summary.csv')
         src_region = params[KEY_REGION]
         dst_region = params[KEY_DST_REGION]
         if not os.path.exists(configs_path):
             logging.exception(f'The table {PAR_CONFIG_LISTS} must be on input!')
 
+        progress = ProgressReporter(count_csv_rows(configs_path),
+                                    interval=params.get(KEY_PROGRESS_INTERVAL, DEFAULT_PROGRESS_INTERVAL))
+        logging.info(f'Found {progress.total_rows} configurations to transfer.')
+        kbcapi_scripts.BACKOFF_LISTENERS.append(progress.on_backoff)
+        progress.start()
+        try:
+            self._transfer_configs(configs_path, out_file_path, src_region, dst_region, progress)
+        finally:
+            progress.stop()
+            kbcapi_scripts.BACKOFF_LISTENERS.remove(progress.on_backoff)
+            # recorded for failed runs too, so their throughput can be compared
+            summary = progress.summary()
+            logging.info(f'Run summary: {summary}')
+            self._write_run_summary(summary_file_path, summary)
+
+        self.configuration.write_table_manifest(out_file_path,
+                                                primary_key=['project_id', 'region', 'src_cfg_id', 'dst_cfg_id',
+                                                             'component_id'], incremental=True)
+        logging.info("Done!")
+
+    def _transfer_configs(self, configs_path, out_file_path, src_region, dst_region, progress):
+        params = self.cfg_params
         with open(configs_path, mode='rt', encoding='utf-8') as in_file, open(out_file_path, mode='w+',
                                                                               encoding='utf-8') as out_file:
             reader = csv.DictReader(in_file, lineterminator='\n')
@@ -108,11 +135,14 @@ class Component(KBCEnvHandler):
                                      'dst_cfg_id': result_id,
                                      'component_id': cfg['component_id'],
                                      'time': datetime.datetime.utcnow().isoformat()})
+                progress.row_done()
 
-        self.configuration.write_table_manifest(out_file_path,
-                                                primary_key=['project_id', 'region', 'src_cfg_id', 'dst_cfg_id',
-                                                             'component_id'], incremental=True)
-        logging.info("Done!")
+    def _write_run_summary(self, summary_file_path, summary):
+        with open(summary_file_path, mode='w+', encoding='utf-8') as out_file:
+            writer = csv.DictWriter(out_file, fieldnames=SUMMARY_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerow(summary)
+        self.configuration.write_table_manifest(summary_file_path, primary_key=['start_time'], incremental=True)
 
     def _get_project_storage_token(self, manage_token, project_id, region='EU'):
         project_pk = f'{region}-{project_id}'
@@ -25,6 +25,14 @@ Various Adhoc scripts for KBC api manipulations.
 
 """
 
+# callables notified with the `backoff` details dict on each retried request
+BACKOFF_LISTENERS = []
+
+
+def _notify_backoff(details):
+    for listener in BACKOFF_LISTENERS:
+        listener(details)
+
 
 def run_config(component_id, config_id, token, region='US'):
     values = {
@@ -454,7 +462,8 @@ def invite_user_to_project(token, project_id, email):
         return True
 
 
-@backoff.on_exception(backoff.expo, (HTTPError, requests.ConnectionError), max_tries=3)
+@backoff.on_exception(backoff.expo, (HTTPError, requests.ConnectionError), max_tries=3,
+                      on_backoff=_notify_backoff)
 def generate_token(decription, manage_token, proj_id, region, expires_in=1800, manage_tokens=False,
                    additional_params=None):
     headers = {
@@ -0,0 +1,126 @@
+'''
+Progress, throughput and ETA reporting for long running migrations.
+
+'''
+
+import csv
+import datetime
+import logging
+import threading
+import time
+from collections import deque
+
+from requests import HTTPError
+
+SUMMARY_FIELDS = ['start_time', 'end_time', 'total_rows', 'rows_done', 'elapsed_seconds', 'rows_per_second',
+                  'concurrency', 'retries', 'throttled']
+
+
+def count_csv_rows(path):
+    '''
+    Pre-scans the csv file and returns number of data rows (header excluded).
+    '''
+    with open(path, mode='rt', encoding='utf-8') as in_file:
+        return sum(1 for _ in csv.DictReader(in_file, lineterminator='\n'))
+
+
+class ProgressReporter:
+    '''
+    Tracks processed rows and logs progress, sliding window throughput and ETA every `interval` seconds
+    from a background heartbeat thread (see `start` / `stop`), so slow rows do not leave the log silent.
+
+    Retries and throttled (HTTP 429) requests are counted via `on_backoff`,
+    which is meant to be registered as a `backoff` handler.
+    '''
+
+    def __init__(self, total_rows, interval=60, window=300, concurrency=1, clock=time.monotonic):
+        self.total_rows = total_rows
+        self.interval = interval
+        self.window = window
+        self.concurrency = concurrency
+        self.retries = 0
+        self.throttled = 0
+        self.rows_done = 0
+        self._clock = clock
+        self._start = clock()
+        self._start_time = datetime.datetime.utcnow()
+        # (timestamp, rows_done) samples within the sliding window
+        self._samples = deque([(self._start, 0)])
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._heartbeat = None
+
+    def start(self):
+        self._stopped.clear()
+        self._heartbeat = threading.Thread(target=self._report_periodically, name='progress-heartbeat', daemon=True)
+        self._heartbeat.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+    def _report_periodically(self):
+        while not self._stopped.wait(self.interval):
+            logging.info(self.format_progress())
+
+    def on_backoff(self, details):
+        exc = details['exception']
+        with self._lock:
+            self.retries += 1
+            if isinstance(exc, HTTPError) and exc.response is not None and exc.response.status_code == 429:
+                self.throttled += 1
+
+    def row_done(self):
+        now = self._clock()
+        with self._lock:
+            self.rows_done += 1
+            self._samples.append((now, self.rows_done))
+            # keep a single sample older than the window as the rate baseline
+            while len(self._samples) > 2 and self._samples[1][0] <= now - self.window:
+                self._samples.popleft()
+
+    def rows_per_second(self):
+        '''
+        Throughput over the sliding window.
+        '''
+        with self._lock:
+            first_ts, first_rows = self._samples[0]
+            rows_done = self.rows_done
+        elapsed = self._clock() - first_ts
+        if elapsed <= 0:
+            return 0.0
+        return (rows_done - first_rows) / elapsed
+
+    def eta_seconds(self):
+        rate = self.rows_per_second()
+        remaining = max(self.total_rows - self.rows_done, 0)
+        if remaining == 0:
+            return 0.0
+        if rate <= 0:
+            return None
+        return remaining / rate
+
+    def format_progress(self):
+        eta = self.eta_seconds()
+        eta_str = str(datetime.timedelta(seconds=round(eta))) if eta is not None else 'unknown'
+        percent = 100.0 * self.rows_done / self.total_rows if self.total_rows else 100.0
+        return (f'Progress: {self.rows_done}/{self.total_rows} rows ({percent:.1f}%), '
+                f'{self.rows_per_second():.2f} rows/s, concurrency {self.concurrency}, '
+                f'retries {self.retries}, throttled {self.throttled}, ETA {eta_str}')
+
+    def summary(self):
+        '''
+        Final run statistics, overall throughput is computed over the whole run.
+        '''
+        elapsed = self._clock() - self._start
+        return {'start_time': self._start_time.isoformat(),
+                'end_time': datetime.datetime.utcnow().isoformat(),
+                'total_rows': self.total_rows,
+                'rows_done': self.rows_done,
+                'elapsed_seconds': round(elapsed, 3),
+                'rows_per_second': round(self.rows_done / elapsed, 3) if elapsed > 0 else 0.0,
+                'concurrency': self.concurrency,
+                'retries': self.retries,
+                'throttled': self.throttled}
@@ -3,12 +3,17 @@ Created on 12. 11. 2018
 
 @author: esner
 '''
+import csv
+import json
+import os
+import tempfile
 import unittest
 import mock
-import os
 from freezegun import freeze_time
 
 from component import Component
+from kbc_scripts import kbcapi_scripts
+from progress_reporter import SUMMARY_FIELDS
 
 
 class TestComponent(unittest.TestCase):
@@ -23,6 +28,59 @@ class TestComponent(unittest.TestCase):
             comp.run()
 
 
+class TestComponentProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        data_path = self.data_dir.name
+        for folder in ('in/tables', 'out/tables'):
+            os.makedirs(os.path.join(data_path, folder))
+        with open(os.path.join(data_path, 'config.json'), 'w') as config:
+            json.dump({'parameters': {'#api_token': 'manage', '#src_token': 'src', 'aws_region': 'US',
+                                      'dst_aws_region': 'EU'},
+                       'image_parameters': {}}, config)
+        with open(os.path.join(data_path, 'in/tables/configs.csv'), 'w') as configs:
+            configs.write('project_id,configuration_id,component_id\n'
+                          '1,101,keboola.ex-db\n'
+                          '1,102,keboola.ex-db\n')
+        self.out_path = os.path.join(data_path, 'out/tables')
+        env_patcher = mock.patch.dict(os.environ, {'KBC_DATADIR': data_path})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.addCleanup(self.data_dir.cleanup)
+
+    def _read_summary(self):
+        with open(os.path.join(self.out_path, 'migration_run_summary.csv')) as summary_file:
+            reader = csv.DictReader(summary_file)
+            self.assertEqual(reader.fieldnames, SUMMARY_FIELDS)
+            rows = list(reader)
+        self.assertTrue(os.path.exists(os.path.join(self.out_path, 'migration_run_summary.csv.manifest')))
+        self.assertEqual(len(rows), 1)
+        return rows[0]
+
+    @mock.patch('component.kbcapi_scripts.migrate_configs', return_value=True)
+    @mock.patch('component.kbcapi_scripts.generate_token', return_value={'token': 'dst'})
+    def test_run_writes_summary(self, generate_token, migrate_configs):
+        Component().run()
+
+        self.assertEqual(migrate_configs.call_count, 2)
+        summary = self._read_summary()
+        self.assertEqual(summary['total_rows'], '2')
+        self.assertEqual(summary['rows_done'], '2')
+        self.assertEqual(kbcapi_scripts.BACKOFF_LISTENERS, [])
+
+    @mock.patch('component.kbcapi_scripts.migrate_configs', side_effect=[True, RuntimeError('failed')])
+    @mock.patch('component.kbcapi_scripts.generate_token', return_value={'token': 'dst'})
+    def test_failed_run_writes_summary(self, generate_token, migrate_configs):
+        with self.assertRaises(RuntimeError):
+            Component().run()
+
+        summary = self._read_summary()
+        self.assertEqual(summary['total_rows'], '2')
+        self.assertEqual(summary['rows_done'], '1')
+        self.assertEqual(kbcapi_scripts.BACKOFF_LISTENERS, [])
+
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
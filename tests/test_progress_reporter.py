@@ -0,0 +1,65 @@
+import time
+import unittest
+
+import mock
+from requests import HTTPError
+
+from progress_reporter import ProgressReporter
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressReporter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.reporter = ProgressReporter(10, interval=60, window=100, clock=self.clock)
+
+    def _rows(self, count, seconds_each):
+        for _ in range(count):
+            self.clock.now += seconds_each
+            self.reporter.row_done()
+
+    def test_rate_and_eta_use_sliding_window(self):
+        # slow start falls out of the window
+        self._rows(2, 100)
+        self._rows(4, 10)
+        self.assertAlmostEqual(self.reporter.rows_per_second(), 5 / 140)
+        self.assertAlmostEqual(self.reporter.eta_seconds(), 4 * 140 / 5)
+
+    def test_heartbeat_logs_without_finished_rows(self):
+        reporter = ProgressReporter(10, interval=0.01, clock=self.clock)
+        with mock.patch('progress_reporter.logging.info') as log:
+            reporter.start()
+            time.sleep(0.1)
+            reporter.stop()
+        self.assertGreater(log.call_count, 0)
+        self.assertIn('0/10 rows', log.call_args[0][0])
+        self.assertIn('ETA unknown', log.call_args[0][0])
+
+    def test_counts_retries_and_throttling(self):
+        throttled = HTTPError(response=mock.Mock(status_code=429))
+        failed = HTTPError(response=mock.Mock(status_code=500))
+        self.reporter.on_backoff({'exception': throttled})
+        self.reporter.on_backoff({'exception': failed})
+        summary = self.reporter.summary()
+        self.assertEqual(summary['retries'], 2)
+        self.assertEqual(summary['throttled'], 1)
+
+    def test_summary(self):
+        self._rows(10, 2)
+        summary = self.reporter.summary()
+        self.assertEqual(summary['rows_done'], 10)
+        self.assertEqual(summary['rows_per_second'], 0.5)
+        self.assertEqual(self.reporter.eta_seconds(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()